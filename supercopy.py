@@ -1,25 +1,71 @@
 import os
+import io
 import shutil
 import argparse
 import sys
+import errno
+import re
 import hashlib
 import zipfile
-import py7zr
+import zlib
+import struct
+import mmap
 import subprocess
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import collections
+import itertools
+import functools
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from tqdm import tqdm
 
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog
 import threading
+import multiprocessing
 import ctypes
 import json  # Added json import
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # everywhere but Windows
+    msvcrt = None
+
+try:
+    import deflate  # optional: libdeflate bindings for faster zip inflate
+except ImportError:
+    deflate = None
+
+try:
+    from isal import isal_zlib  # optional: ISA-L's PCLMULQDQ CRC-32 and inflate
+except ImportError:
+    isal_zlib = None
+
+try:
+    from zlib_ng import zlib_ng  # optional: zlib-ng's SIMD inflate
+except ImportError:
+    zlib_ng = None
+
+try:
+    import blake3  # optional: BLAKE3 checksums for --hash blake3
+except ImportError:
+    blake3 = None
+
 # --- HELPER FUNCTIONS ---
 
 
+@functools.lru_cache(maxsize=1)
 def get_version_from_package_json():
     # Determine the base path for package.json
     if getattr(sys, "frozen", False):
@@ -42,72 +88,953 @@ def get_version_from_package_json():
         return "Unknown Version"
 
 
+# Kernel-side copy primitives, probed once at import in the same spirit as
+# shutil's _USE_CP_SENDFILE flag. Neither exists on Windows or macOS, where
+# unverified copies go through shutil.copyfile instead.
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+_USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+_KERNEL_COPY_AVAILABLE = _HAS_COPY_FILE_RANGE or _USE_SENDFILE
+
+# Errors meaning "this syscall cannot copy between these two files" rather
+# than a real I/O failure; on these we drop down to the next strategy.
+_KERNEL_COPY_FALLBACK_ERRNOS = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSOCK,
+}
+
+_O_BINARY = getattr(os, "O_BINARY", 0)
+# Windows' FILE_FLAG_SEQUENTIAL_SCAN: the cache manager reads further ahead
+# and recycles the pages behind the reader, the counterpart of fadvise.
+_O_SEQUENTIAL = getattr(os, "O_SEQUENTIAL", 0)
+
+# Largest request handed to one copy_file_range/sendfile call. Linux caps a
+# single transfer just under 2GB anyway, so a 1GB request moves as much as
+# the kernel will per syscall while staying a well-defined unit of work.
+_KERNEL_COPY_CHUNK = 1024 * 1024 * 1024  # 1GB
+# When progress is reported the requests are smaller, so the bar moves.
+_KERNEL_COPY_PROGRESS_CHUNK = 16 * 1024 * 1024
+
+
+def _retry(func, *args):
+    """Calls an I/O function, retrying transient EINTR/EAGAIN failures."""
+    while True:
+        try:
+            return func(*args)
+        except (InterruptedError, BlockingIOError):
+            continue
+
+
+def _kernel_copy(in_fd, out_fd, count, progress_callback=None):
+    """Copies up to `count` bytes between file descriptors inside the kernel.
+
+    Tries copy_file_range first, then sendfile. Both advance the descriptors'
+    file offsets, so the caller can finish any remainder with a plain
+    read/write loop. Returns the number of bytes copied (0 if unsupported),
+    each of which was also sent to progress_callback as a "bytes" event.
+    """
+    chunk = _KERNEL_COPY_CHUNK
+    if progress_callback is not None:
+        chunk = _KERNEL_COPY_PROGRESS_CHUNK
+    copied = 0
+    if _HAS_COPY_FILE_RANGE:
+        try:
+            while copied < count:
+                sent = _retry(
+                    os.copy_file_range,
+                    in_fd,
+                    out_fd,
+                    min(count - copied, chunk),
+                )
+                if sent == 0:
+                    break
+                copied += sent
+                if progress_callback is not None:
+                    progress_callback("bytes", sent)
+            return copied
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_FALLBACK_ERRNOS:
+                raise
+
+    if _USE_SENDFILE:
+        try:
+            while copied < count:
+                sent = _retry(
+                    os.sendfile,
+                    out_fd,
+                    in_fd,
+                    None,
+                    min(count - copied, chunk),
+                )
+                if sent == 0:
+                    break
+                copied += sent
+                if progress_callback is not None:
+                    progress_callback("bytes", sent)
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_FALLBACK_ERRNOS:
+                raise
+
+    return copied
+
+
+# ioctl(FICLONE) asks btrfs/XFS/bcachefs to share the source's extents with
+# the destination: an O(1) copy whose integrity the filesystem guarantees.
+_FICLONE = 0x40049409
+
+
+def _try_reflink(src_fd, dst_fd):
+    """Clones src_fd into dst_fd on Linux. Returns True on success."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        return True
+    except OSError:
+        return False  # cross-filesystem, or the filesystem cannot clone
+
+
+def _load_clonefile():
+    """Returns macOS's clonefile(2) through ctypes, or None elsewhere."""
+    if sys.platform != "darwin":
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        clonefile = libc.clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+
+_clonefile = _load_clonefile()
+
+
+def _try_clonefile(source_path, dest_path):
+    """Clones a file on APFS. Returns True on success."""
+    if _clonefile is None or os.path.lexists(dest_path):
+        return False  # clonefile refuses to replace an existing file
+    return _clonefile(os.fsencode(source_path), os.fsencode(dest_path), 0) == 0
+
+
+def _load_copy_file_ex():
+    """Returns kernel32's CopyFileExW through ctypes, or None off Windows."""
+    if sys.platform != "win32":
+        return None
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    copy_file_ex = kernel32.CopyFileExW
+    copy_file_ex.argtypes = (
+        ctypes.c_wchar_p,
+        ctypes.c_wchar_p,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_uint32,
+    )
+    copy_file_ex.restype = ctypes.c_int
+    return copy_file_ex
+
+
+_CopyFileExW = _load_copy_file_ex()
+
+if _CopyFileExW is not None:
+    _PROGRESS_ROUTINE = ctypes.WINFUNCTYPE(
+        ctypes.c_uint32,  # return: PROGRESS_CONTINUE, ...
+        ctypes.c_longlong,  # TotalFileSize
+        ctypes.c_longlong,  # TotalBytesTransferred
+        ctypes.c_longlong,  # StreamSize
+        ctypes.c_longlong,  # StreamBytesTransferred
+        ctypes.c_uint32,  # dwStreamNumber
+        ctypes.c_uint32,  # dwCallbackReason
+        ctypes.c_void_p,  # hSourceFile
+        ctypes.c_void_p,  # hDestinationFile
+        ctypes.c_void_p,  # lpData
+    )
+
+# Files at least this large report "bytes" progress while they copy, so
+# one big file does not leave the progress bars frozen.
+_SUBFILE_PROGRESS_MIN_SIZE = 16 * 1024 * 1024
+_COPY_FILE_NO_BUFFERING = 0x1000
+# Lets an EFS-encrypted source land decrypted on a volume without EFS, as
+# the hashing read/write loop (and shutil) would, instead of failing.
+_COPY_FILE_ALLOW_DECRYPTED_DESTINATION = 0x0008
+
+
+def _copy_file_win32(source_path, dest_path, progress_callback=None, unbuffered=False):
+    """Copies a file with CopyFileExW, letting Windows move the data.
+
+    When progress_callback is given it receives ("bytes", delta) events as
+    the copy advances. Returns the number of bytes reported that way.
+    unbuffered bypasses the system cache, like O_DIRECT.
+    """
+    reported = 0
+    routine = None
+    if progress_callback is not None:
+
+        def on_progress(total, transferred, *_):
+            nonlocal reported
+            if transferred > reported:
+                progress_callback("bytes", transferred - reported)
+                reported = transferred
+            return 0  # PROGRESS_CONTINUE
+
+        routine = _PROGRESS_ROUTINE(on_progress)
+
+    flags = _COPY_FILE_ALLOW_DECRYPTED_DESTINATION
+    if unbuffered:
+        flags |= _COPY_FILE_NO_BUFFERING
+    if not _CopyFileExW(source_path, dest_path, routine, None, None, flags):
+        raise ctypes.WinError(ctypes.get_last_error())
+    return reported
+
+
+_HASH_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+def _make_sha256():
+    """Builds a SHA-256 object from OpenSSL's EVP layer.
+
+    OpenSSL dispatches to SHA-NI / ARMv8 SHA instructions on its own; asking
+    for a non-security hash skips FIPS bookkeeping where Python supports it.
+    """
+    try:
+        return hashlib.new("sha256", usedforsecurity=False)
+    except TypeError:  # Python < 3.9
+        return hashlib.sha256()
+
+
+# Fresh hash objects are cloned from one pristine instance: copying an EVP
+# context is cheaper than looking the digest up again for every small file.
+_SHA256_TEMPLATE = _make_sha256()
+
+
+def _new_sha256():
+    """Returns an empty SHA-256 object."""
+    return _SHA256_TEMPLATE.copy()
+
+
+def _new_blake3():
+    """Returns an empty BLAKE3 hasher that spreads large inputs over cores.
+
+    BLAKE3 is a tree hash by design, so one file's verification scales
+    across SIMD lanes and threads without changing the digest.
+    """
+    return blake3.blake3(max_threads=blake3.blake3.AUTO)
+
+
+# Checksums selectable for verification, by name.
+_HASH_FACTORIES = {"sha256": _new_sha256, "blake3": _new_blake3}
+
+
+def _hash_file(file_path, new_hash=_new_sha256):
+    """Computes the hex digest of a file (SHA-256 unless new_hash says so).
+
+    The file is memory-mapped so the hash consumes it in a single C call;
+    small, very large or unmappable files are read in chunks instead.
+    """
+    sha256 = new_hash()
+    with open(file_path, "rb", buffering=0) as f:
+        # Setting up and tearing down a mapping costs more than it saves on
+        # small files, which dominate when verifying a large tree; those
+        # hash straight from a single read.
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise"):
+                        # Aggressive readahead for the single front-to-back
+                        # pass; WILLNEED would fault in the whole file at once.
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    sha256.update(mm)
+                return sha256.hexdigest()
+            except (ValueError, OSError, OverflowError):
+                # 32-bit builds run out of address space on huge files.
+                sha256 = new_hash()
+        # Read into the thread's buffer: f.read() would allocate a fresh
+        # 1MB bytes object per call, even for a file of a few bytes.
+        buf = _get_copy_buffer(_HASH_CHUNK_SIZE)
+        with memoryview(buf) as view:
+            while n := f.readinto(buf):
+                sha256.update(view[:n])
+    return sha256.hexdigest()
+
+
+# Tree hashing (--verify-fast): files of at least _TREE_HASH_MIN_SIZE get
+# the SHA-256 of the SHA-256 digests of their consecutive _TREE_HASH_BLOCK
+# blocks. The blocks are independent, so the destination check hashes them
+# on every core instead of one stream per file. Not comparable to sha256sum.
+_TREE_HASH_MIN_SIZE = 64 * 1024 * 1024
+_TREE_HASH_BLOCK = 16 * 1024 * 1024
+
+_block_executor = None
+_block_executor_lock = threading.Lock()
+
+
+def _get_block_executor():
+    """Returns the process-wide thread pool for work split within one file.
+
+    Tree-hash blocks and range copies run here. Its tasks never wait on
+    each other, so copy workers can share it without deadlocking.
+    """
+    global _block_executor
+    with _block_executor_lock:
+        if _block_executor is None:
+            _block_executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 4,
+                thread_name_prefix="supercopy-block",
+                initializer=_unpin_thread,
+            )
+    return _block_executor
+
+
+class _TreeSha256:
+    """Streaming form of the tree hash, with the hashlib update/hexdigest API."""
+
+    def __init__(self):
+        self._digests = []
+        self._block = _new_sha256()
+        self._filled = 0
+
+    def update(self, data):
+        with memoryview(data) as view:
+            offset = 0
+            while offset < len(view):
+                take = min(len(view) - offset, _TREE_HASH_BLOCK - self._filled)
+                with view[offset : offset + take] as part:
+                    self._block.update(part)
+                offset += take
+                self._filled += take
+                if self._filled == _TREE_HASH_BLOCK:
+                    self._digests.append(self._block.digest())
+                    self._block = _new_sha256()
+                    self._filled = 0
+
+    def hexdigest(self):
+        digests = self._digests
+        if self._filled:
+            digests = digests + [self._block.digest()]
+        top = _new_sha256()
+        top.update(b"".join(digests))
+        return top.hexdigest()
+
+
+def _tree_hash_file(file_path):
+    """Computes a file's tree hash, hashing its blocks in parallel."""
+    with open(file_path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+
+                    def digest_block(offset):
+                        sha256 = _new_sha256()
+                        with view[offset : offset + _TREE_HASH_BLOCK] as block:
+                            sha256.update(block)
+                        return sha256.digest()
+
+                    offsets = range(0, size, _TREE_HASH_BLOCK)
+                    digests = list(_get_block_executor().map(digest_block, offsets))
+            top = _new_sha256()
+            top.update(b"".join(digests))
+            return top.hexdigest()
+        except (ValueError, OSError, OverflowError):
+            pass  # empty, or too large for a 32-bit address space
+
+        tree = _TreeSha256()
+        buf = _get_copy_buffer(_HASH_CHUNK_SIZE)
+        with memoryview(buf) as view:
+            while n := f.readinto(buf):
+                tree.update(view[:n])
+        return tree.hexdigest()
+
+
+# Unverified files at least this large are copied as independent
+# _RANGE_COPY_CHUNK ranges on the block pool. A single copy_file_range
+# stream keeps one request in flight; several overlap on NVMe and SMB.
+_RANGE_COPY_MIN_SIZE = 256 * 1024 * 1024
+_RANGE_COPY_CHUNK = 64 * 1024 * 1024
+
+
+def _copy_range_rw(src_fd, dst_fd, pos, end, progress_callback=None):
+    """Copies bytes [pos, end) with pread/pwrite; end=None copies up to EOF.
+
+    Returns the position after the last byte copied.
+    """
+    buf = _get_copy_buffer(_DEFAULT_BUFFER_SIZE)
+    with memoryview(buf) as view:
+        while end is None or pos < end:
+            want = len(buf) if end is None else min(len(buf), end - pos)
+            n = _retry(os.preadv, src_fd, [view[:want]], pos)
+            if n == 0:
+                break  # end of the source (it may have shrunk)
+            written = 0
+            while written < n:
+                written += _retry(os.pwrite, dst_fd, view[written:n], pos + written)
+            pos += n
+            if progress_callback is not None:
+                progress_callback("bytes", n)
+    return pos
+
+
+def _copy_range(src_fd, dst_fd, offset, end, progress_callback=None):
+    """Copies bytes [offset, end) at explicit offsets; end=None means to EOF.
+
+    copy_file_range can return 0 before the end on some filesystems, so
+    whatever it leaves goes through pread/pwrite. Returns the number of
+    bytes copied, which is only short if the source shrank.
+    """
+    pos = offset
+    while end is None or pos < end:
+        count = _RANGE_COPY_CHUNK if end is None else end - pos
+        sent = _retry(os.copy_file_range, src_fd, dst_fd, count, pos, pos)
+        if sent == 0:
+            break
+        pos += sent
+        if progress_callback is not None:
+            progress_callback("bytes", sent)
+    if end is None or pos < end:
+        pos = _copy_range_rw(src_fd, dst_fd, pos, end, progress_callback)
+    return pos - offset
+
+
+def _copy_ranges(src_fd, dst_fd, size, progress_callback=None):
+    """Copies a file of at least `size` bytes as ranges copied in parallel.
+
+    The last range runs to EOF, so bytes appended since the stat are
+    copied too. The descriptors' file offsets are left untouched. Returns
+    the number of bytes sent to progress_callback as "bytes" events, or
+    None when copy_file_range cannot copy between these files.
+    """
+    offsets = range(0, size, _RANGE_COPY_CHUNK)
+    ends = [*offsets[1:], None]
+    try:
+        # The first range runs here, so an unsupported pair of files fails
+        # before any other range has started.
+        copied = _copy_range(src_fd, dst_fd, 0, ends[0], progress_callback)
+    except OSError as e:
+        if e.errno not in _KERNEL_COPY_FALLBACK_ERRNOS:
+            raise
+        return None
+    executor = _get_block_executor()
+    futures = [
+        executor.submit(_copy_range, src_fd, dst_fd, offset, end, progress_callback)
+        for offset, end in zip(offsets[1:], ends[1:])
+    ]
+    # Every range must be done before the caller closes the descriptors,
+    # even when one of them failed.
+    wait(futures)
+    for future in futures:
+        copied += future.result()
+    return copied if progress_callback is not None else 0
+
+
+def _write_all(fd, data):
+    """Writes the whole buffer to a file descriptor, handling short writes."""
+    # Regular files almost never short-write, so the common case is a single
+    # os.write (which drops the GIL) with no Python-side slicing around it.
+    written = _retry(os.write, fd, data)
+    if written < len(data):
+        view = memoryview(data)[written:]
+        while view:
+            written = _retry(os.write, fd, view)
+            view = view[written:]
+
+
+_O_DIRECT = getattr(os, "O_DIRECT", 0)
+# Files above this size are read with O_DIRECT in the userspace copy loop so
+# read-once data does not evict the rest of the page cache.
+_DIRECT_IO_THRESHOLD = 16 * 1024 * 1024
+# With direct_io set, files above this size bypass the page cache on both
+# ends, so copying files larger than RAM does not flush everything else.
+_DIRECT_IO_MIN_SIZE = 1024 * 1024 * 1024  # 1GB
+
+_FADV_SEQUENTIAL = getattr(os, "POSIX_FADV_SEQUENTIAL", None)
+_FADV_DONTNEED = getattr(os, "POSIX_FADV_DONTNEED", None)
+
+
+def _fadvise(fd, advice):
+    """Passes a page-cache hint for the whole file where the OS supports it."""
+    if advice is None:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass  # purely advisory
+
+
+# fallocate(2) mode that reserves blocks without moving the end of file, so a
+# source that shrinks mid-copy never leaves a zero-padded destination.
+_FALLOC_FL_KEEP_SIZE = 0x01
+_FILE_ALLOCATION_INFO = 5  # FILE_INFO_BY_HANDLE_CLASS.FileAllocationInfo
+
+
+def _load_preallocate():
+    """Returns a function reserving disk space for an open descriptor, or None.
+
+    os.posix_fallocate is not used: where the filesystem lacks fallocate,
+    glibc emulates it by writing to every block, which costs more than it saves.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            fallocate = ctypes.CDLL(None, use_errno=True).fallocate64
+        except (OSError, AttributeError):
+            return None
+        fallocate.argtypes = (
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int64,
+            ctypes.c_int64,
+        )
+        fallocate.restype = ctypes.c_int
+
+        def preallocate(fd, size):
+            fallocate(fd, _FALLOC_FL_KEEP_SIZE, 0, size)
+
+        return preallocate
+    if msvcrt is not None:
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        set_file_info = kernel32.SetFileInformationByHandle
+        set_file_info.argtypes = (
+            ctypes.c_void_p,
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.c_uint32,
+        )
+        set_file_info.restype = ctypes.c_int
+
+        def preallocate(fd, size):
+            allocation = ctypes.c_longlong(size)
+            set_file_info(
+                msvcrt.get_osfhandle(fd),
+                _FILE_ALLOCATION_INFO,
+                ctypes.byref(allocation),
+                ctypes.sizeof(allocation),
+            )
+
+        return preallocate
+    return None
+
+
+# Failures are ignored: the copy itself extends the file either way.
+_preallocate = _load_preallocate()
+
+_thread_buffers = threading.local()
+
+# Files below this size are copied in batches of _SMALL_FILE_BATCH per pool
+# task; for tiny files the per-future overhead rivals the copy itself.
+_SMALL_FILE_SIZE = 64 * 1024
+_SMALL_FILE_BATCH = 256
+
+
+def _get_copy_buffer(size):
+    """Returns this thread's reusable copy buffer of at least `size` bytes.
+
+    Anonymous mmaps are always page-aligned, which O_DIRECT requires, and
+    reusing one per worker avoids allocating a fresh bytes object per read.
+    """
+    size = -(-size // mmap.PAGESIZE) * mmap.PAGESIZE
+    buf = getattr(_thread_buffers, "buf", None)
+    if buf is None or len(buf) < size:
+        buf = mmap.mmap(-1, size)
+        _thread_buffers.buf = buf
+    return buf
+
+
+def _enable_direct_io(fd):
+    """Switches an open descriptor to O_DIRECT where the filesystem allows.
+
+    Returns True if the descriptor is now in direct mode.
+    """
+    if not (_O_DIRECT and fcntl):
+        return False
+    try:
+        flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags | _O_DIRECT)
+        return True
+    except OSError:
+        return False  # e.g. tmpfs; the copy simply stays buffered
+
+
+def _disable_direct_io(fd):
+    """Returns a descriptor switched on by _enable_direct_io to buffered mode."""
+    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+    fcntl.fcntl(fd, fcntl.F_SETFL, flags & ~_O_DIRECT)
+
+
+def _copy_loop(
+    src_fd, dst_fd, buffer_size, sha256=None, progress_callback=None, direct_dst=False
+):
+    """Copies the rest of src_fd to dst_fd through the thread's buffer.
+
+    direct_dst says dst_fd is in O_DIRECT mode. Returns the number of bytes
+    sent to progress_callback as "bytes" events.
+    """
+    buf = _get_copy_buffer(buffer_size)
+    reported = 0
+    # FileIO.readinto is a plain read(2) into our buffer on every platform
+    # (os.readv is POSIX-only).
+    reader = io.FileIO(src_fd, "rb", closefd=False)
+    with memoryview(buf) as view:
+        while n := _retry(reader.readinto, buf):
+            chunk = view[:n]
+            if sha256 is not None:
+                sha256.update(chunk)
+            if direct_dst and n % mmap.PAGESIZE:
+                # O_DIRECT only takes block-aligned lengths; the short tail
+                # of the file goes through the page cache.
+                _disable_direct_io(dst_fd)
+                direct_dst = False
+            _write_all(dst_fd, chunk)
+            if progress_callback is not None:
+                progress_callback("bytes", n)
+                reported += n
+    return reported
+
+
+# Verified copies of files in this range map the source instead of reading
+# it: the hash and the write both consume the page-cache pages directly.
+# Larger files are mapped a window at a time, which bounds the address space
+# in use and gives progress a chance to move; past the upper limit the
+# direct-I/O loop is cheaper than faulting in that much page cache.
+_MMAP_MIN_SIZE = 64 * 1024
+_MMAP_MAX_SIZE = 2 * 1024 * 1024 * 1024
+_MMAP_WINDOW = 16 * 1024 * 1024  # a multiple of every allocation granularity
+
+
+def _copy_mapped(src_fd, dst_fd, size, sha256, progress_callback=None):
+    """Hashes and writes a file from read-only mappings of it.
+
+    Returns the number of bytes sent to progress_callback as "bytes" events.
+    """
+    reported = 0
+    for offset in range(0, size, _MMAP_WINDOW):
+        length = min(_MMAP_WINDOW, size - offset)
+        with mmap.mmap(src_fd, length, access=mmap.ACCESS_READ, offset=offset) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+                if hasattr(mmap, "MADV_WILLNEED"):
+                    mm.madvise(mmap.MADV_WILLNEED)
+            sha256.update(mm)
+            _write_all(dst_fd, mm)
+        if progress_callback is not None:
+            progress_callback("bytes", length)
+            reported += length
+    return reported
+
+
+def _copy_small_file(source_path, dest_path, size, sha256=None):
+    """Copies a file below _SMALL_FILE_SIZE with one read and one write.
+
+    For tiny files the general path's clone attempt, fstat, kernel-copy call
+    and end-of-file read outnumber the syscalls that move data. The size
+    comes from enumeration; reading one byte past it catches a file that
+    has grown since.
+    """
+    src_fd = os.open(source_path, os.O_RDONLY | _O_BINARY)
+    try:
+        data = os.read(src_fd, size + 1)
+        if len(data) > size:
+            chunks = [data]
+            while chunk := os.read(src_fd, _SMALL_FILE_SIZE):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+    finally:
+        os.close(src_fd)
+
+    dst_fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY)
+    try:
+        _write_all(dst_fd, data)
+    finally:
+        os.close(dst_fd)
+    if sha256 is not None:
+        sha256.update(data)
+        return sha256.hexdigest()
+    return None
+
+
 # --- CORE ENGINE ---
 
+# Seconds between "scan" progress events while a source tree is listed.
+_SCAN_PROGRESS_INTERVAL = 0.25
+
+
+class VerificationError(Exception):
+    """Raised when a copied file's checksum does not match its source."""
+
 
 class CopyEngine:
     """Encapsulates the core logic for high-performance file copying."""
 
-    def get_file_list(self, source_dir):
-        """Generates a list of all files and their total size."""
-        file_list = []
+    def __init__(
+        self, direct_io=False, tree_hash=False, pin_threads=False, hash_name="sha256"
+    ):
+        if hash_name == "blake3" and blake3 is None:
+            raise ValueError("BLAKE3 verification needs the 'blake3' package.")
+        # Bypass the OS cache for files above _DIRECT_IO_MIN_SIZE.
+        self.direct_io = direct_io
+        # Verify files above _TREE_HASH_MIN_SIZE with the parallel tree hash
+        # (SHA-256 only; BLAKE3 is a tree hash already).
+        self.tree_hash = tree_hash and hash_name == "sha256"
+        # Keep each copy thread, and its buffer, on one CPU's caches.
+        self.pin_threads = pin_threads
+        self.new_hash = _HASH_FACTORIES[hash_name]
+        # Set per run: clones only work within one filesystem, so across two
+        # every file would pay for a failing clone syscall.
+        self.same_filesystem = True
+
+    def get_file_list(self, source_dir, dest_dir, workers=1, progress_callback=None):
+        """Generates a list of (source, destination, size) and the total size.
+
+        Also returns every destination directory, parents before children,
+        so empty directories are recreated too. While listing, progress_callback
+        gets ("scan", {"files": n, "bytes": size}) events with the running
+        totals, so a slow share does not look stalled.
+
+        Directories are listed concurrently: on network shares and slow
+        disks the walk is bound by syscall latency, which threads overlap.
+        Files are ordered by inode number, which on most filesystems tracks
+        on-disk placement, so workers read the tree roughly sequentially.
+        """
+        entries = []
         total_size = 0
-        for root, _, files in os.walk(source_dir):
-            for file in files:
-                source_path = os.path.join(root, file)
-                relative_path = os.path.relpath(root, source_dir)
+        # A directory is only queued once its parent's listing is in, so
+        # recording them at submit time keeps parents ahead of children.
+        dir_list = [dest_dir]
+        next_report = time.monotonic() + _SCAN_PROGRESS_INTERVAL
+        with ThreadPoolExecutor(max_workers=min(32, max(1, workers) * 4)) as executor:
+            pending = {executor.submit(self._scan_dir, source_dir, dest_dir)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    entries.extend(files)
+                    total_size += sum(entry[1][2] for entry in files)
+                    for top, dest_top in subdirs:
+                        dir_list.append(dest_top)
+                        pending.add(executor.submit(self._scan_dir, top, dest_top))
+                if progress_callback is not None and time.monotonic() >= next_report:
+                    progress_callback(
+                        "scan", {"files": len(entries), "bytes": total_size}
+                    )
+                    next_report = time.monotonic() + _SCAN_PROGRESS_INTERVAL
+        entries.sort(key=lambda e: e[0])
+        file_list = [entry for _, entry in entries]
+        return file_list, total_size, dir_list
+
+    def _scan_dir(self, top, dest_top):
+        """Lists one directory for get_file_list.
+
+        Returns its files as (inode, (source, destination, size)) and its
+        subdirectories as (source, destination) pairs. Sizes come from
+        DirEntry.stat(), which Windows serves from the directory listing
+        instead of a separate stat per file. Like os.walk, symlinked
+        directories are not entered.
+        """
+        files = []
+        subdirs = []
+        try:
+            it = os.scandir(top)
+        except OSError:
+            return files, subdirs
+        with it:
+            for entry in it:
                 try:
-                    file_size = os.path.getsize(source_path)
-                    total_size += file_size
-                    file_list.append((source_path, relative_path, file, file_size))
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append(
+                                (entry.path, os.path.join(dest_top, entry.name))
+                            )
+                        continue
+                    st = entry.stat()
                 except OSError:
                     continue
-        return file_list, total_size
+                dest_path = os.path.join(dest_top, entry.name)
+                files.append((st.st_ino, (entry.path, dest_path, st.st_size)))
+        return files, subdirs
 
     def _copy_file_task(
-        self, source_path, dest_path, buffer_size, verify, progress_callback
+        self, source_path, dest_path, file_size, buffer_size, verify, progress_callback
     ):
-        """The actual file copy operation performed by a worker thread."""
+        """The actual file copy operation performed by a worker thread.
+
+        file_size is the size recorded during enumeration and is what gets
+        reported to progress_callback, saving a stat of the destination.
+        """
         try:
             original_checksum = None
-            if verify:
-                sha256 = hashlib.sha256()
-                with open(source_path, "rb") as f:
-                    while chunk := f.read(buffer_size):
-                        sha256.update(chunk)
-                original_checksum = sha256.hexdigest()
-
-            with open(source_path, "rb") as fsrc, open(dest_path, "wb") as fdest:
-                while chunk := fsrc.read(buffer_size):
-                    fdest.write(chunk)
+            reported = 0  # bytes already sent as "bytes" progress events
+            tree = self.tree_hash and file_size >= _TREE_HASH_MIN_SIZE
+
+            if self.same_filesystem and _try_clonefile(source_path, dest_path):
+                pass  # APFS now shares the blocks; nothing to copy or verify
+            elif not verify and _CopyFileExW is not None:
+                large = file_size >= _SUBFILE_PROGRESS_MIN_SIZE
+                reported = _copy_file_win32(
+                    source_path,
+                    dest_path,
+                    progress_callback if large else None,
+                    self.direct_io and file_size > _DIRECT_IO_MIN_SIZE,
+                )
+            elif not verify and not _KERNEL_COPY_AVAILABLE:
+                # shutil picks the platform's own fast path where it has one
+                # (fcopyfile on macOS) and a large readinto loop otherwise.
+                shutil.copyfile(source_path, dest_path)
+            elif file_size < _SMALL_FILE_SIZE:
+                original_checksum = _copy_small_file(
+                    source_path,
+                    dest_path,
+                    file_size,
+                    self.new_hash() if verify else None,
+                )
+            else:
+                large = file_size >= _SUBFILE_PROGRESS_MIN_SIZE
+                sha256 = None
+                if verify:
+                    sha256 = _TreeSha256() if tree else self.new_hash()
+                original_checksum, reported = self._copy_file_data(
+                    source_path,
+                    dest_path,
+                    buffer_size,
+                    sha256,
+                    progress_callback if large else None,
+                )
 
             if verify and original_checksum:
-                if not self._verify_checksum(dest_path, original_checksum):
-                    raise Exception("Checksum mismatch")
+                if not self._verify_checksum(dest_path, original_checksum, tree):
+                    raise VerificationError("Checksum mismatch")
 
-            file_size = os.path.getsize(dest_path)
-            progress_callback("file", file_size)
+            progress_callback("file", max(file_size - reported, 0))
             return (source_path, None)
-        except Exception as e:
+        except (OSError, ValueError, VerificationError) as e:
+            # OSError covers every I/O and shutil failure; ValueError is what
+            # mmap raises if the source shrinks between stat and mapping.
             progress_callback("file", 0)
             return (source_path, str(e))
 
-    def _verify_checksum(self, file_path, original_checksum):
-        """Verifies the SHA-256 checksum of a file."""
-        sha256 = hashlib.sha256()
+    def _copy_file_data(
+        self, source_path, dest_path, buffer_size, sha256=None, progress_callback=None
+    ):
+        """Copies file contents via raw descriptors.
+
+        Returns (digest, reported): the hex digest of the source fed through
+        sha256 when one is given and the data was actually copied (a reflink
+        needs no verification), and the bytes already sent as "bytes" events.
+        """
+        src_fd = os.open(source_path, os.O_RDONLY | _O_BINARY | _O_SEQUENTIAL)
+        try:
+            dst_fd = os.open(
+                dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY
+            )
+            try:
+                if self.same_filesystem and _try_reflink(src_fd, dst_fd):
+                    return None, 0  # shared extents are identical by construction
+
+                file_size = os.fstat(src_fd).st_size
+                # Small files are not worth the extra syscalls.
+                advise = file_size >= _SMALL_FILE_SIZE
+                if advise:
+                    _fadvise(src_fd, _FADV_SEQUENTIAL)
+                    if _preallocate is not None:
+                        # One contiguous reservation instead of growing the
+                        # file extent by extent as the chunks land.
+                        _preallocate(dst_fd, file_size)
+                direct = self.direct_io and file_size > _DIRECT_IO_MIN_SIZE
+                try:
+                    if sha256 is not None:
+                        # Hash the source as it streams to the destination so
+                        # it is read once; only the destination is re-read.
+                        if not direct and _MMAP_MIN_SIZE <= file_size < _MMAP_MAX_SIZE:
+                            reported = _copy_mapped(
+                                src_fd, dst_fd, file_size, sha256, progress_callback
+                            )
+                        else:
+                            if file_size > _DIRECT_IO_THRESHOLD:
+                                _enable_direct_io(src_fd)
+                            reported = _copy_loop(
+                                src_fd,
+                                dst_fd,
+                                buffer_size,
+                                sha256,
+                                progress_callback,
+                                direct and _enable_direct_io(dst_fd),
+                            )
+                        return sha256.hexdigest(), reported
+
+                    if direct:
+                        # The kernel copy goes through the page cache.
+                        _enable_direct_io(src_fd)
+                        reported = _copy_loop(
+                            src_fd,
+                            dst_fd,
+                            buffer_size,
+                            progress_callback=progress_callback,
+                            direct_dst=_enable_direct_io(dst_fd),
+                        )
+                        return None, reported
+
+                    if _HAS_COPY_FILE_RANGE and file_size >= _RANGE_COPY_MIN_SIZE:
+                        reported = _copy_ranges(
+                            src_fd, dst_fd, file_size, progress_callback
+                        )
+                        if reported is not None:
+                            return None, reported
+
+                    copied = _kernel_copy(src_fd, dst_fd, file_size, progress_callback)
+                    # Finishes whatever the kernel did not copy (e.g. when the
+                    # syscalls are unsupported for this pair of files).
+                    _copy_loop(src_fd, dst_fd, buffer_size)
+                    return None, copied if progress_callback is not None else 0
+                finally:
+                    if advise:
+                        # Both sides were touched exactly once; let the kernel
+                        # drop them rather than evict other processes' data.
+                        _fadvise(src_fd, _FADV_DONTNEED)
+                        _fadvise(dst_fd, _FADV_DONTNEED)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+    def _copy_file_batch(self, batch, buffer_size, verify, progress_callback):
+        """Copies a list of (source, destination, size) in one worker call.
+
+        Returns the (path, error) pairs for the files that failed.
+        """
+        failed = []
+        for source_path, dest_path, file_size in batch:
+            path, error = self._copy_file_task(
+                source_path,
+                dest_path,
+                file_size,
+                buffer_size,
+                verify,
+                progress_callback,
+            )
+            if error:
+                failed.append((path, error))
+        return failed
+
+    def _verify_checksum(self, file_path, original_checksum, tree=False):
+        """Verifies a file's checksum (the tree hash when tree is set)."""
         try:
-            with open(file_path, "rb") as f:
-                while chunk := f.read(4096):
-                    sha256.update(chunk)
-            return sha256.hexdigest() == original_checksum
-        except Exception:
+            if tree:
+                return _tree_hash_file(file_path) == original_checksum
+            return _hash_file(file_path, self.new_hash) == original_checksum
+        except OSError:
             return False
 
     def run_copy(
         self, source, destination, workers, buffer_size, verify, progress_callback
     ):
-        """Executes the copy operation for a source file or directory."""
+        """Executes the copy operation for a source file or directory.
+
+        buffer_size only sizes the userspace loop; None picks the default.
+        """
         errors = []
+        if buffer_size is None:
+            buffer_size = _DEFAULT_BUFFER_SIZE
         source = os.path.abspath(source)
         destination = os.path.abspath(destination)
 
@@ -124,7 +1051,21 @@ class CopyEngine:
                 else destination
             )
 
-            file_list, total_size = self.get_file_list(source)
+            file_list, total_size, dir_list = self.get_file_list(
+                source, dest_dir, workers, progress_callback
+            )
+
+            # Parents come first, so a single mkdir per directory suffices.
+            for d in dir_list:
+                try:
+                    os.mkdir(d)
+                except FileExistsError:
+                    pass
+                except FileNotFoundError:
+                    # Only the root can get here, when the destination's own
+                    # parents do not exist yet.
+                    os.makedirs(d, exist_ok=True)
+            self.same_filesystem = _same_device(source, dest_dir)
 
             if not file_list:
                 progress_callback("finish", 0)
@@ -132,41 +1073,97 @@ class CopyEngine:
 
             progress_callback("start", {"files": len(file_list), "bytes": total_size})
 
-            required_dirs = {
-                os.path.join(dest_dir, rel_path) for _, rel_path, _, _ in file_list
-            }
-            for d in required_dirs:
-                os.makedirs(d, exist_ok=True)
-
-            with ThreadPoolExecutor(max_workers=workers) as executor:
-                futures = {
-                    executor.submit(
-                        self._copy_file_task,
-                        src_path,
-                        os.path.join(dest_dir, rel_path, file_name),
-                        buffer_size,
-                        verify,
-                        progress_callback,
-                    )
-                    for src_path, rel_path, file_name, _ in file_list
-                }
+            if (
+                len(file_list) <= _INLINE_COPY_MAX_FILES
+                and total_size < _INLINE_COPY_MAX_BYTES
+            ):
+                # Starting a pool would cost more than copying these.
+                errors = self._copy_file_batch(
+                    file_list, buffer_size, verify, progress_callback
+                )
+                progress_callback("finish", 0)
+                return errors
+
+            # Large files get a task each; small ones are grouped so the pool
+            # overhead per task is spread over many files, and stay in the
+            # list's inode order. Large files go first, biggest first, so a
+            # huge file is never left copying alone at the end of the run.
+            large_files = []
+            small_files = []
+            for job in file_list:
+                if job[2] < _SMALL_FILE_SIZE:
+                    small_files.append(job)
+                else:
+                    large_files.append(job)
+            large_files.sort(key=lambda job: job[2], reverse=True)
+            batches = [[job] for job in large_files]
+            for i in range(0, len(small_files), _SMALL_FILE_BATCH):
+                batches.append(small_files[i : i + _SMALL_FILE_BATCH])
+
+            # Large verified copies are dominated by hashing, so they run in
+            # worker processes; progress comes back over a queue because the
+            # callback cannot cross the process boundary.
+            use_processes = verify and total_size > _PROCESS_POOL_MIN_BYTES
+            if use_processes:
+                progress_queue = multiprocessing.Queue()
+                drainer = threading.Thread(
+                    target=_forward_progress,
+                    args=(progress_queue, progress_callback),
+                    daemon=True,
+                )
+                drainer.start()
+                executor = ProcessPoolExecutor(
+                    max_workers=min(workers, _MAX_PROCESS_WORKERS),
+                    initializer=_init_copy_process,
+                    initargs=(progress_queue,),
+                )
+                task = _copy_batch_in_process
+                task_args = (buffer_size, verify, self)
+            else:
+                initializer, initargs = None, ()
+                if self.pin_threads and _set_thread_affinity is not None:
+                    initializer = _pin_worker_thread
+                    initargs = (itertools.cycle(_allowed_cpus()),)
+                executor = ThreadPoolExecutor(
+                    max_workers=workers, initializer=initializer, initargs=initargs
+                )
+                task = self._copy_file_batch
+                task_args = (buffer_size, verify, progress_callback)
 
-                for future in as_completed(futures):
-                    path, error = future.result()
-                    if error:
-                        errors.append((path, error))
+            # Keep only a few tasks per worker queued at a time instead of a
+            # Future per batch for the whole tree.
+            max_in_flight = 4 * workers
+            try:
+                with executor:
+                    pending = set()
+                    for batch in batches:
+                        if len(pending) >= max_in_flight:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                errors.extend(future.result())
+                        pending.add(executor.submit(task, batch, *task_args))
+
+                    for future in as_completed(pending):
+                        errors.extend(future.result())
+            finally:
+                if use_processes:
+                    # Workers have exited and flushed their events by now,
+                    # so the sentinel is the last item on the queue.
+                    progress_queue.put(None)
+                    drainer.join()
         else:  # It's a single file
             if os.path.isdir(destination):
                 dest_file = os.path.join(destination, os.path.basename(source))
             else:
                 dest_file = destination
             os.makedirs(os.path.dirname(dest_file), exist_ok=True)
+            self.same_filesystem = _same_device(source, os.path.dirname(dest_file))
 
             file_size = os.path.getsize(source)
             progress_callback("start", {"files": 1, "bytes": file_size})
 
             _, error = self._copy_file_task(
-                source, dest_file, buffer_size, verify, progress_callback
+                source, dest_file, file_size, buffer_size, verify, progress_callback
             )
             if error:
                 errors = [(source, error)]
@@ -175,10 +1172,230 @@ class CopyEngine:
         return errors
 
 
+# Default read/write chunk: large enough for deep readahead and big DMA
+# bursts on SSDs, small enough to keep one per worker thread.
+_DEFAULT_BUFFER_SIZE = 4 * 1024 * 1024  # 4MB
+
+
+def _same_device(path, other):
+    """Tells whether two existing paths live on the same filesystem."""
+    try:
+        return os.stat(path).st_dev == os.stat(other).st_dev
+    except OSError:
+        return True  # let the per-file attempts find out
+
+
+# Directory copies this small run in the calling thread, without a pool.
+_INLINE_COPY_MAX_FILES = 8
+_INLINE_COPY_MAX_BYTES = 16 * 1024 * 1024
+
+# Verified directory copies above this size use worker processes instead of
+# threads so hashing scales across cores.
+_PROCESS_POOL_MIN_BYTES = 100 * 1024 * 1024
+# ProcessPoolExecutor cannot wait on more than 61 workers on Windows.
+_MAX_PROCESS_WORKERS = 61 if sys.platform == "win32" else 1 << 16
+
+_process_progress_queue = None
+
+
+def _init_copy_process(progress_queue):
+    """Initializer for copy worker processes."""
+    global _process_progress_queue
+    _process_progress_queue = progress_queue
+
+
+def _queue_progress(event_type, data):
+    """Progress callback used inside worker processes."""
+    _process_progress_queue.put((event_type, data))
+
+
+def _copy_batch_in_process(batch, buffer_size, verify, engine):
+    """Runs engine._copy_file_batch inside a worker process.
+
+    The engine is pickled along with each batch; it only holds options.
+    """
+    return engine._copy_file_batch(batch, buffer_size, verify, _queue_progress)
+
+
+def _forward_progress(progress_queue, progress_callback):
+    """Relays worker-process progress events until a None sentinel."""
+    while (event := progress_queue.get()) is not None:
+        progress_callback(*event)
+
+
+def _load_set_thread_affinity():
+    """Returns a function pinning the calling thread to one CPU, or None."""
+    if hasattr(os, "sched_setaffinity"):
+        # On Linux, pid 0 means the calling thread rather than the process.
+        return lambda cpu: os.sched_setaffinity(0, {cpu})
+    if sys.platform != "win32":
+        return None
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.GetCurrentThread.restype = ctypes.c_void_p
+    set_mask = kernel32.SetThreadAffinityMask
+    set_mask.argtypes = (ctypes.c_void_p, ctypes.c_size_t)
+    set_mask.restype = ctypes.c_size_t
+
+    def set_affinity(cpu):
+        if not set_mask(kernel32.GetCurrentThread(), 1 << cpu):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    return set_affinity
+
+
+_set_thread_affinity = _load_set_thread_affinity()
+
+
+# The CPUs the process started with. Linux threads inherit their creator's
+# affinity, so a thread started from a pinned copy worker would otherwise
+# be stuck on that worker's CPU.
+_PROCESS_CPUS = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+
+
+def _allowed_cpus():
+    """Returns the logical CPUs this process may run on."""
+    if _PROCESS_CPUS is not None:
+        return sorted(_PROCESS_CPUS)
+    # A thread affinity mask only covers the first processor group.
+    return list(range(min(os.cpu_count() or 1, ctypes.sizeof(ctypes.c_size_t) * 8)))
+
+
+def _unpin_thread():
+    """Block pool initializer: widens a new thread back to _PROCESS_CPUS.
+
+    The pool starts its threads inside submit(), on whichever thread calls
+    it, which with --pin-threads is a copy worker pinned to a single CPU.
+    Windows threads start with the process mask and need nothing here.
+    """
+    if _PROCESS_CPUS is not None:
+        try:
+            os.sched_setaffinity(0, _PROCESS_CPUS)
+        except OSError:
+            pass  # e.g. a CPU went offline; keep the inherited mask
+
+
+def _pin_worker_thread(cpus):
+    """Thread pool initializer: pins each new worker to the next CPU.
+
+    cpus is a shared itertools.cycle; next() on it is atomic under the GIL.
+    """
+    try:
+        _set_thread_affinity(next(cpus))
+    except OSError:
+        pass  # e.g. the CPU went offline; the worker just stays unpinned
+
+
+# Window for streaming decompressed zip members to disk; zipfile's own
+# extract() copies through a much smaller buffer.
+_UNPACK_BUFFER_SIZE = 1024 * 1024  # 1MB
+_WINDOWS_ILLEGAL_CHARS = re.compile(r'[:<>|"?*]')
+# 7-Zip's -bsp1 progress: "NN%" optionally followed by the files done so far.
+# It redraws in place with backspaces, so it never ends a line.
+_7Z_PROGRESS = re.compile(rb"(\d+)%(?: (\d+))?")
+# How much of 7-Zip's output to keep for the error message.
+_7Z_OUTPUT_TAIL = 4096
+
+# Zip local file header: signature, version, flags, method, time, date,
+# CRC-32, compressed size, uncompressed size, name length, extra length.
+_ZIP_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+# Fastest available CRC-32 for checking fast-path zip members: ISA-L and
+# libdeflate fold with carry-less multiplies, zlib's is table-driven.
+if isal_zlib is not None:
+    _crc32 = isal_zlib.crc32
+elif deflate is not None and hasattr(deflate, "crc32"):
+    _crc32 = deflate.crc32
+else:
+    _crc32 = zlib.crc32
+# Members up to this size are inflated in one libdeflate call when the
+# optional `deflate` package is installed; larger ones are streamed.
+_FAST_UNZIP_MAX_SIZE = 64 * 1024 * 1024
+# Streaming inflate for everything else: ISA-L and zlib-ng both decode
+# with SIMD and keep zlib's decompressobj API.
+_inflate = isal_zlib or zlib_ng or zlib
+
+
+class _SevenZipProgress:
+    """Forwards py7zr's extraction reports to a progress callback.
+
+    `pending` maps archive names to sizes; reported entries are removed
+    from it. py7zr reports from its own thread, which can lag behind
+    extractall(), so `flush()` settles the leftovers under the same lock.
+    Entries of _SUBFILE_PROGRESS_MIN_SIZE or more also send "bytes" events
+    as py7zr decompresses them.
+    """
+
+    def __init__(self, pending, progress_callback):
+        self.pending = pending
+        self.progress_callback = progress_callback
+        self._lock = threading.Lock()
+        self._current = None  # entry being decompressed
+        self._partial = 0  # its bytes already sent as "bytes" events
+
+    def report_start_preparation(self):
+        pass
+
+    def report_start(self, processing_file_path, processing_bytes):
+        with self._lock:
+            self._current = processing_file_path
+            self._partial = 0
+
+    def report_update(self, decompressed_bytes):
+        # A delta since the previous update, sent at most once a second.
+        delta = int(decompressed_bytes)
+        with self._lock:
+            # Small entries are left to report_end; a settled one (by flush)
+            # is no longer pending at all.
+            if self.pending.get(self._current, 0) < _SUBFILE_PROGRESS_MIN_SIZE:
+                return
+            self._partial += delta
+        self.progress_callback("bytes", delta)
+
+    def report_end(self, processing_file_path, wrote_bytes):
+        with self._lock:
+            size = self.pending.pop(processing_file_path, None)
+            if size is not None and processing_file_path == self._current:
+                size = max(size - self._partial, 0)
+        if size is not None:
+            self.progress_callback("file", size)
+
+    def flush(self):
+        """Reports every entry py7zr has not reported yet."""
+        with self._lock:
+            if self._current in self.pending:
+                size = self.pending[self._current]
+                self.pending[self._current] = max(size - self._partial, 0)
+            sizes = list(self.pending.values())
+            self.pending.clear()
+        for size in sizes:
+            self.progress_callback("file", size)
+
+    def report_postprocess(self):
+        pass
+
+    def report_warning(self, message):
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _load_py7zr():
+    """Imports py7zr on first use, keeping it out of every startup.
+
+    py7zr only accepts ExtractCallback instances, so _SevenZipProgress is
+    registered as a virtual subclass of it here.
+    """
+    import py7zr
+    from py7zr.callbacks import ExtractCallback
+
+    ExtractCallback.register(_SevenZipProgress)
+    return py7zr
+
+
 class UnpackEngine:
     """Encapsulates the logic for unpacking various archive formats."""
 
-    def run_unpack(self, archive_path, destination_path, progress_callback):
+    def run_unpack(
+        self, archive_path, destination_path, progress_callback, workers=None
+    ):
         archive_path = os.path.abspath(archive_path)
         destination_path = os.path.abspath(destination_path)
 
@@ -191,7 +1408,12 @@ class UnpackEngine:
         ext = ext.lower()
 
         if ext == ".zip":
-            self._unpack_zip(archive_path, destination_path, progress_callback)
+            self._unpack_zip(
+                archive_path,
+                destination_path,
+                progress_callback,
+                workers or os.cpu_count() or 4,
+            )
         elif ext == ".7z":
             self._unpack_7z(archive_path, destination_path, progress_callback)
         elif ext == ".rar":
@@ -201,31 +1423,197 @@ class UnpackEngine:
 
         progress_callback("finish", 0)
 
-    def _unpack_zip(self, archive_path, dest_path, callback):
+    def _unpack_zip(self, archive_path, dest_path, callback, workers):
         with zipfile.ZipFile(archive_path, "r") as zip_ref:
             members = zip_ref.infolist()
-            total_size = sum(f.file_size for f in members)
-            callback("start", {"files": len(members), "bytes": total_size})
+        total_size = sum(f.file_size for f in members)
+        callback("start", {"files": len(members), "bytes": total_size})
+
+        # Lay out the directory tree up front so workers only write files.
+        jobs = []
+        required_dirs = set()
+        for member in members:
+            target = self._zip_member_path(member, dest_path)
+            if member.is_dir():
+                required_dirs.add(target)
+            else:
+                required_dirs.add(os.path.dirname(target))
+                jobs.append((member, target))
+        for d in sorted(required_dirs, key=len):
+            os.makedirs(d, exist_ok=True)
+        for member in members:
+            if member.is_dir():
+                callback("file", 0)
+
+        # zlib releases the GIL while inflating, so members decompress in
+        # parallel. Each worker gets its own ZipFile: a shared one would
+        # serialise every read on its internal file lock.
+        local = threading.local()
+        handles = []
+        archive_map = self._map_archive(archive_path)
+
+        def extract_one(member, target):
+            if archive_map is not None and self._extract_zip_member_fast(
+                archive_map, member, target
+            ):
+                return member.file_size
+            zip_ref = getattr(local, "zip_ref", None)
+            if zip_ref is None:
+                zip_ref = local.zip_ref = zipfile.ZipFile(archive_path, "r")
+                handles.append(zip_ref)
+            with zip_ref.open(member) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, _UNPACK_BUFFER_SIZE)
+            return member.file_size
 
-            for member in members:
-                zip_ref.extract(member, dest_path)
-                callback("file", member.file_size)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(extract_one, member, target)
+                    for member, target in jobs
+                ]
+                try:
+                    for future in as_completed(futures):
+                        callback("file", future.result())
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            for zip_ref in handles:
+                zip_ref.close()
+            if archive_map is not None:
+                archive_map.close()
+
+    @staticmethod
+    def _map_archive(archive_path):
+        """Maps the archive read-only, or returns None if it cannot be."""
+        try:
+            with open(archive_path, "rb") as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, OverflowError):
+            return None
+
+    @staticmethod
+    def _extract_zip_member_fast(archive_map, member, target):
+        """Extracts a STORED or DEFLATED member straight from the mapping.
+
+        Members up to _FAST_UNZIP_MAX_SIZE decompress in one libdeflate call
+        when it is installed; the rest stream through _inflate, without
+        zipfile's Python-level read loop. Returns False when the member is
+        not eligible (encrypted or another compression method), in which
+        case the caller falls back to zipfile.
+        """
+        if member.flag_bits & 0x1 or member.compress_type not in (
+            zipfile.ZIP_STORED,
+            zipfile.ZIP_DEFLATED,
+        ):
+            return False
+
+        offset = member.header_offset
+        header = archive_map[offset : offset + _ZIP_LOCAL_HEADER.size]
+        fields = _ZIP_LOCAL_HEADER.unpack(header)
+        if fields[0] != b"PK\x03\x04":
+            raise zipfile.BadZipFile(f"Bad local header for {member.filename}")
+        start = offset + _ZIP_LOCAL_HEADER.size + fields[9] + fields[10]
+        end = start + member.compress_size
+
+        if deflate is not None and member.file_size <= _FAST_UNZIP_MAX_SIZE:
+            raw = archive_map[start:end]
+            if member.compress_type == zipfile.ZIP_DEFLATED:
+                data = deflate.deflate_decompress(raw, member.file_size)
+            else:
+                data = raw
+            crc, size = _crc32(data), len(data)
+            with open(target, "wb") as dst:
+                dst.write(data)
+        else:
+            with memoryview(archive_map) as view, open(target, "wb") as dst:
+                crc, size = UnpackEngine._stream_zip_member(
+                    view, start, end, member.compress_type, dst
+                )
+
+        if size != member.file_size or crc != member.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {member.filename}")
+        return True
+
+    @staticmethod
+    def _stream_zip_member(view, start, end, compress_type, dst):
+        """Writes view[start:end], inflated if DEFLATED, to dst in chunks.
+
+        Returns the CRC-32 and length of what was written.
+        """
+        crc = size = 0
+        inflater = None
+        if compress_type == zipfile.ZIP_DEFLATED:
+            inflater = _inflate.decompressobj(-zlib.MAX_WBITS)
+        for pos in range(start, end, _UNPACK_BUFFER_SIZE):
+            with view[pos : min(pos + _UNPACK_BUFFER_SIZE, end)] as chunk:
+                if inflater is None:
+                    crc = _crc32(chunk, crc)
+                    size += len(chunk)
+                    dst.write(chunk)
+                    continue
+                # Bound each output chunk: a highly compressible input chunk
+                # could otherwise inflate to gigabytes in one call.
+                data = inflater.decompress(chunk, _UNPACK_BUFFER_SIZE)
+                while data:
+                    crc = _crc32(data, crc)
+                    size += len(data)
+                    dst.write(data)
+                    data = inflater.decompress(
+                        inflater.unconsumed_tail, _UNPACK_BUFFER_SIZE
+                    )
+        if inflater is not None and (data := inflater.flush()):
+            crc = _crc32(data, crc)
+            size += len(data)
+            dst.write(data)
+        return crc, size
+
+    @staticmethod
+    def _zip_member_path(member, dest_path):
+        """Maps a zip member to a path under dest_path.
+
+        Applies the same sanitising as ZipFile.extract: drive letters,
+        absolute paths and '..' components are dropped, and characters
+        that are illegal in Windows file names are replaced.
+        """
+        arcname = member.filename.replace("/", os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+        arcname = os.path.splitdrive(arcname)[1]
+        parts = [
+            part
+            for part in arcname.split(os.path.sep)
+            if part not in ("", os.path.curdir, os.path.pardir)
+        ]
+        if os.path.sep == "\\":
+            parts = [
+                _WINDOWS_ILLEGAL_CHARS.sub("_", part).rstrip(".") for part in parts
+            ]
+            parts = [part for part in parts if part]
+        return os.path.join(dest_path, *parts)
 
     def _unpack_7z(self, archive_path, dest_path, callback):
+        py7zr = _load_py7zr()
         with py7zr.SevenZipFile(archive_path, mode="r") as z:
             members = z.list()
             total_size = sum(f.uncompressed for f in members if not f.is_directory)
             callback("start", {"files": len(members), "bytes": total_size})
 
-            z.extractall(path=dest_path)
+            pending = {}
             for f in members:
-                callback("file", f.uncompressed if not f.is_directory else 0)
+                if f.is_directory:
+                    callback("file", 0)
+                else:
+                    pending[f.filename] = f.uncompressed
 
-    def _unpack_rar(self, archive_path, dest_path, callback):
-        total_size = 1
-        total_files = 1
-        callback("start", {"files": total_files, "bytes": total_size})
+            # Report each file as py7zr finishes writing it, so progress moves
+            # during extraction instead of jumping to 100% at the end.
+            progress = _SevenZipProgress(pending, callback)
+            z.extractall(path=dest_path, callback=progress)
+            progress.flush()
 
+    def _unpack_rar(self, archive_path, dest_path, callback):
         try:
             if getattr(sys, "frozen", False):
                 exe_dir = os.path.dirname(sys.executable)
@@ -236,25 +1624,64 @@ class UnpackEngine:
             if os.path.exists(os.path.join(exe_dir, "7z.exe")):
                 tool_path = os.path.join(exe_dir, "7z.exe")
 
-            command = [tool_path, "x", archive_path, f"-o{dest_path}", "-y"]
+            startupinfo = None
+            if sys.platform == "win32":
+                startupinfo = subprocess.STARTUPINFO()
+                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
 
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-
-            result = subprocess.run(
+            total_files, total_size = self._list_with_7z(
+                tool_path, archive_path, startupinfo
+            )
+            callback("start", {"files": total_files, "bytes": total_size})
+
+            # Progress goes to stdout and everything else is silenced, so the
+            # pipe carries little more than percentages; errors share it.
+            command = [
+                tool_path,
+                "x",
+                archive_path,
+                f"-o{dest_path}",
+                "-y",
+                "-bsp1",
+                "-bso0",
+            ]
+            proc = subprocess.Popen(
                 command,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 startupinfo=startupinfo,
-                check=False,
             )
-
-            if result.returncode != 0:
+            files_done = bytes_done = 0
+            tail = b""
+            with proc.stdout:
+                while chunk := proc.stdout.read1(_7Z_OUTPUT_TAIL):
+                    tail = (tail + chunk)[-_7Z_OUTPUT_TAIL:]
+                    progress = _7Z_PROGRESS.findall(chunk)
+                    if not progress:
+                        continue
+                    percent, files = progress[-1]
+                    done = min(int(percent), 100) * total_size // 100
+                    if done > bytes_done:
+                        callback("bytes", done - bytes_done)
+                        bytes_done = done
+                    files = min(int(files or 0), total_files)
+                    for _ in range(files - files_done):
+                        callback("file", 0)
+                    files_done = max(files, files_done)
+
+            if proc.wait() != 0:
+                output = tail.replace(b"\b", b"").decode(errors="replace").strip()
                 raise Exception(
-                    f"7-Zip failed to unpack {archive_path}. Error: {result.stderr}"
+                    f"7-Zip failed to unpack {archive_path}. Error: {output}"
                 )
 
-            callback("file", total_size)
+            # Settle whatever the last progress line did not cover.
+            for _ in range(total_files - files_done - 1):
+                callback("file", 0)
+            if files_done < total_files:
+                callback("file", max(total_size - bytes_done, 0))
+            elif total_size > bytes_done:
+                callback("bytes", total_size - bytes_done)
 
         except FileNotFoundError:
             raise Exception(
@@ -263,6 +1690,67 @@ class UnpackEngine:
         except Exception as e:
             raise Exception(f"Unpacking .rar files failed. Error: {e}")
 
+    @staticmethod
+    def _list_with_7z(tool_path, archive_path, startupinfo):
+        """Returns the entry count and unpacked size from `7z l -slt`.
+
+        Falls back to (1, 1) when the listing fails, so progress still has
+        a total to reach.
+        """
+        result = subprocess.run(
+            [tool_path, "l", "-slt", "-ba", archive_path],
+            capture_output=True,
+            startupinfo=startupinfo,
+            check=False,
+        )
+        if result.returncode != 0:
+            return 1, 1
+        entries = total_size = 0
+        for line in result.stdout.splitlines():
+            key, sep, value = line.partition(b" = ")
+            if not sep:
+                continue
+            if key == b"Path":
+                entries += 1
+            elif key == b"Size" and value.strip().isdigit():
+                total_size += int(value)
+        return max(entries, 1), total_size
+
+
+# Milliseconds between GUI progress redraws.
+_GUI_POLL_INTERVAL_MS = 50
+
+# Source paths ending in one of these switch the GUI to unpack mode.
+_ARCHIVE_EXTS = (".zip", ".rar", ".7z")
+# Seconds the browse button waits on a stat before assuming a folder; a
+# stale network share can otherwise hang the Tk thread for much longer.
+_PATH_PROBE_TIMEOUT = 0.1
+_SOURCE_FILETYPES = [
+    ("All Files", "*.*"),
+    ("ZIP Archive", "*.zip"),
+    ("7-Zip Archive", "*.7z"),
+    ("RAR Archive", "*.rar"),
+]
+
+
+def _format_size(num_bytes):
+    """Formats a byte count for the status line, in MB or GB."""
+    size_mb = num_bytes / (1024 * 1024)
+    if size_mb > 1024:
+        return f"{size_mb/1024:.1f} GB"
+    return f"{size_mb:.1f} MB"
+
+
+def _isfile_within(path, timeout):
+    """os.path.isfile that gives up and returns False after timeout seconds."""
+    result = []
+    probe = threading.Thread(
+        target=lambda: result.append(os.path.isfile(path)), daemon=True
+    )
+    probe.start()
+    probe.join(timeout)
+    return bool(result and result[0])
+
 
 class SuperCopyApp(ctk.CTk):
     def __init__(self):
@@ -282,8 +1770,22 @@ class SuperCopyApp(ctk.CTk):
         self.dest_path = tk.StringVar()
         self.verify_files = tk.BooleanVar()
         self.is_unpack_mode = False
+        # Mode the mode-dependent labels currently show; None forces a redraw.
+        self._shown_unpack_mode = None
         self.is_running = False
 
+        # Worker threads only append here; _poll_progress applies the events
+        # on the Tk thread, so widgets redraw at a fixed rate, not per file.
+        self._progress_events = collections.deque()
+        # Only one operation runs at a time, so the engines are reused.
+        self._copy_engine = CopyEngine()
+        self._unpack_engine = UnpackEngine()
+        # Pay for the py7zr import while the window lays out, not on the
+        # first Unpack click.
+        threading.Thread(target=_load_py7zr, daemon=True).start()
+        self.total_files = self.total_bytes = 0
+        self.copied_files = self.copied_bytes = 0
+
         # Main container with padding
         self.main_frame = ctk.CTkFrame(self, fg_color="transparent")
         self.main_frame.grid(
@@ -492,33 +1994,14 @@ class SuperCopyApp(ctk.CTk):
         # Set minimum window size
         self.minsize(650, 600)
 
-    def browse_source(self):
-        current_path = self.source_path.get()
-        try:
-            is_file = os.path.isfile(current_path)
-        except Exception:
-            is_file = False
-
-        if is_file or any(
-            current_path.lower().endswith(ext) for ext in [".zip", ".rar", ".7z"]
-        ):
-            path = filedialog.askopenfilename(title="Select a source file")
-        else:
-            path = filedialog.askdirectory(title="Select a source folder")
-
-        if path:
-            self.source_path.set(path)
-
-    def browse_destination(self):
-        path = filedialog.askdirectory()
-        if path:
-            self.dest_path.set(path)
+        self.after(_GUI_POLL_INTERVAL_MS, self._poll_progress)
 
     def update_ui_mode(self, *args):
         source = self.source_path.get()
-        is_archive = any(
-            source.lower().endswith(ext) for ext in [".zip", ".rar", ".7z"]
-        )
+        is_archive = source.lower().endswith(_ARCHIVE_EXTS)
+        if is_archive == self._shown_unpack_mode:
+            return  # fires per keystroke; most do not change the mode
+        self._shown_unpack_mode = is_archive
 
         if is_archive:
             self.is_unpack_mode = True
@@ -546,9 +2029,34 @@ class SuperCopyApp(ctk.CTk):
         if is_running:
             self.action_button.configure(text="⚡ Processing...")
         else:
+            self._shown_unpack_mode = None  # the button text was replaced
             self.update_ui_mode()
 
     def gui_progress_callback(self, event_type, data):
+        """Queues a progress event; called from worker threads."""
+        self._progress_events.append((event_type, data))
+
+    def _poll_progress(self):
+        """Applies queued progress events on the Tk thread and reschedules."""
+        moved = False
+        while self._progress_events:
+            event_type, data = self._progress_events.popleft()
+            if event_type in ("file", "bytes"):
+                # "bytes" is partial progress inside one large file.
+                if event_type == "file":
+                    self.copied_files += 1
+                self.copied_bytes += data
+                moved = True
+            else:
+                if moved:
+                    self._show_progress()
+                    moved = False
+                self._handle_progress_event(event_type, data)
+        if moved:
+            self._show_progress()
+        self.after(_GUI_POLL_INTERVAL_MS, self._poll_progress)
+
+    def _handle_progress_event(self, event_type, data):
         if event_type == "start":
             self.total_files = data["files"]
             self.total_bytes = data["bytes"]
@@ -563,57 +2071,16 @@ class SuperCopyApp(ctk.CTk):
                 status_text = f"📋 Starting copy... Found {self.total_files} files"
 
             if self.total_bytes > 0:
-                size_mb = self.total_bytes / (1024 * 1024)
-                if size_mb > 1024:
-                    size_text = f" ({size_mb/1024:.1f} GB)"
-                else:
-                    size_text = f" ({size_mb:.1f} MB)"
-                status_text += size_text
+                status_text += f" ({_format_size(self.total_bytes)})"
 
             self.status_label.configure(text=status_text)
 
-        elif event_type == "file":
-            self.copied_files += 1
-            self.copied_bytes += data
-
-            file_progress = (
-                self.copied_files / self.total_files if self.total_files > 0 else 0
-            )
-            byte_progress = (
-                self.copied_bytes / self.total_bytes if self.total_bytes > 0 else 0
+        elif event_type == "scan":
+            self.status_label.configure(
+                text=f"🔍 Scanning... Found {data['files']} files"
+                f" ({_format_size(data['bytes'])})"
             )
 
-            self.pbar_files.set(file_progress)
-            self.pbar_bytes.set(byte_progress)
-
-            # Calculate speed and ETA
-            elapsed_time = time.time() - getattr(self, "start_time", time.time())
-            if elapsed_time > 0:
-                bytes_per_second = self.copied_bytes / elapsed_time
-                if bytes_per_second > 0:
-                    remaining_bytes = self.total_bytes - self.copied_bytes
-                    eta_seconds = remaining_bytes / bytes_per_second
-
-                    if eta_seconds < 60:
-                        eta_text = f" - ETA: {eta_seconds:.0f}s"
-                    elif eta_seconds < 3600:
-                        eta_text = f" - ETA: {eta_seconds/60:.0f}m"
-                    else:
-                        eta_text = f" - ETA: {eta_seconds/3600:.1f}h"
-                else:
-                    eta_text = ""
-            else:
-                eta_text = ""
-
-            if self.is_unpack_mode:
-                status_text = f"📦 Extracted: {self.copied_files}/{self.total_files} files{eta_text}"
-            else:
-                status_text = (
-                    f"📋 Copied: {self.copied_files}/{self.total_files} files{eta_text}"
-                )
-
-            self.status_label.configure(text=status_text)
-
         elif event_type == "finish":
             if self.is_unpack_mode:
                 self.status_label.configure(
@@ -625,6 +2092,64 @@ class SuperCopyApp(ctk.CTk):
                 )
             self.set_ui_state(False)
 
+        # Posted by _safe_run_copy/_safe_run_unpack after the engine returns.
+        elif event_type == "errors":
+            self._show_errors(data)
+
+        elif event_type == "failed":
+            self._show_operation_error(data)
+
+    def _show_progress(self):
+        """Redraws the progress bars and status line from the counters."""
+        file_progress = (
+            self.copied_files / self.total_files if self.total_files > 0 else 0
+        )
+        byte_progress = (
+            self.copied_bytes / self.total_bytes if self.total_bytes > 0 else 0
+        )
+
+        # CustomTkinter redraws a whole canvas on every set() and configure(),
+        # so skip the ones that would not move a pixel, e.g. while a single
+        # large file trickles in.
+        for bar, progress in (
+            (self.pbar_files, file_progress),
+            (self.pbar_bytes, byte_progress),
+        ):
+            progress = round(min(max(progress, 0), 1), 3)  # set() clamps too
+            if progress != bar.get():
+                bar.set(progress)
+
+        # Calculate speed and ETA
+        elapsed_time = time.time() - getattr(self, "start_time", time.time())
+        if elapsed_time > 0:
+            bytes_per_second = self.copied_bytes / elapsed_time
+            if bytes_per_second > 0:
+                remaining_bytes = self.total_bytes - self.copied_bytes
+                eta_seconds = remaining_bytes / bytes_per_second
+
+                if eta_seconds < 60:
+                    eta_text = f" - ETA: {eta_seconds:.0f}s"
+                elif eta_seconds < 3600:
+                    eta_text = f" - ETA: {eta_seconds/60:.0f}m"
+                else:
+                    eta_text = f" - ETA: {eta_seconds/3600:.1f}h"
+            else:
+                eta_text = ""
+        else:
+            eta_text = ""
+
+        if self.is_unpack_mode:
+            status_text = (
+                f"📦 Extracted: {self.copied_files}/{self.total_files} files{eta_text}"
+            )
+        else:
+            status_text = (
+                f"📋 Copied: {self.copied_files}/{self.total_files} files{eta_text}"
+            )
+
+        if status_text != self.status_label.cget("text"):
+            self.status_label.configure(text=status_text)
+
     def start_operation(self):
         source = self.source_path.get()
         dest = self.dest_path.get()
@@ -658,16 +2183,14 @@ class SuperCopyApp(ctk.CTk):
 
         thread_args = (source, dest, self.gui_progress_callback)
         if self.is_unpack_mode:
-            engine = UnpackEngine()
             thread = threading.Thread(target=self._safe_run_unpack, args=thread_args)
         else:
-            engine = CopyEngine()
             # Note: GUI doesn't have a workers setting, defaults to os.cpu_count()
             full_args = (
                 source,
                 dest,
                 os.cpu_count() or 4,
-                1048576,
+                None,  # the engine's default buffer
                 self.verify_files.get(),
                 self.gui_progress_callback,
             )
@@ -679,23 +2202,22 @@ class SuperCopyApp(ctk.CTk):
     def _safe_run_copy(self, source, dest, workers, buffer_size, verify, callback):
         """Wrapper for safe copy operation with error handling."""
         try:
-            engine = CopyEngine()
-            errors = engine.run_copy(
+            errors = self._copy_engine.run_copy(
                 source, dest, workers, buffer_size, verify, callback
             )
             if errors:
-                # Schedule error reporting in main thread
-                self.after(0, lambda: self._show_errors(errors))
+                # Queued behind run_copy's own "finish", so the summary is
+                # what stays on screen.
+                self.gui_progress_callback("errors", errors)
         except Exception as e:
-            self.after(0, lambda: self._show_operation_error(str(e)))
+            self.gui_progress_callback("failed", str(e))
 
     def _safe_run_unpack(self, source, dest, callback):
         """Wrapper for safe unpack operation with error handling."""
         try:
-            engine = UnpackEngine()
-            engine.run_unpack(source, dest, callback)
+            self._unpack_engine.run_unpack(source, dest, callback)
         except Exception as e:
-            self.after(0, lambda: self._show_operation_error(str(e)))
+            self.gui_progress_callback("failed", str(e))
 
     def _show_errors(self, errors):
         """Display errors in the UI."""
@@ -717,35 +2239,54 @@ class SuperCopyApp(ctk.CTk):
         self.status_label.configure(text=f"❌ Operation failed: {error_msg}")
         print(f"\n❌ Operation failed: {error_msg}")
 
+    def _browse(self, variable, is_file, title, filetypes=None):
+        """Opens a file or folder picker and stores the choice in variable."""
+        if is_file:
+            options = {"filetypes": filetypes} if filetypes else {}
+            path = filedialog.askopenfilename(title=title, **options)
+        else:
+            path = filedialog.askdirectory(title=title)
+        if path:
+            variable.set(path)
+
     def browse_source(self):
         current_path = self.source_path.get()
-        try:
-            is_file = os.path.isfile(current_path)
-        except Exception:
-            is_file = False
-
-        if is_file or any(
-            current_path.lower().endswith(ext) for ext in [".zip", ".rar", ".7z"]
-        ):
-            path = filedialog.askopenfilename(
-                title="Select a source file",
-                filetypes=[
-                    ("All Files", "*.*"),
-                    ("ZIP Archive", "*.zip"),
-                    ("7-Zip Archive", "*.7z"),
-                    ("RAR Archive", "*.rar"),
-                ],
+        is_file = current_path.lower().endswith(_ARCHIVE_EXTS) or (
+            bool(current_path) and _isfile_within(current_path, _PATH_PROBE_TIMEOUT)
+        )
+        if is_file:
+            self._browse(
+                self.source_path, True, "Select a source file", _SOURCE_FILETYPES
             )
         else:
-            path = filedialog.askdirectory(title="Select a source folder")
-
-        if path:
-            self.source_path.set(path)
+            self._browse(self.source_path, False, "Select a source folder")
 
     def browse_destination(self):
-        path = filedialog.askdirectory(title="Select destination folder")
-        if path:
-            self.dest_path.set(path)
+        self._browse(self.dest_path, False, "Select destination folder")
+
+
+_SW_HIDE = 0
+
+
+def _hide_console_window():
+    """Hides the console window the GUI was started from, on Windows."""
+    if sys.platform != "win32":
+        return
+    try:
+        kernel32 = ctypes.WinDLL("kernel32")
+        user32 = ctypes.WinDLL("user32")
+    except OSError:
+        return
+    # Window handles are pointer-sized; ctypes' default int would truncate.
+    get_console_window = kernel32.GetConsoleWindow
+    get_console_window.argtypes = ()
+    get_console_window.restype = ctypes.c_void_p
+    show_window = user32.ShowWindow
+    show_window.argtypes = (ctypes.c_void_p, ctypes.c_int)
+    show_window.restype = ctypes.c_int
+    console_window = get_console_window()
+    if console_window:
+        show_window(console_window, _SW_HIDE)
 
 
 def main_gui():
@@ -754,6 +2295,10 @@ def main_gui():
     app.mainloop()
 
 
+# Seconds between CLI progress bar redraws.
+_CLI_REFRESH_INTERVAL = 0.2
+
+
 def main_cli():
     """Function to run the tool in command-line mode."""
     current_version = get_version_from_package_json()  # Get version here
@@ -781,20 +2326,41 @@ def main_cli():
         "--workers",
         type=int,
         default=os.cpu_count() or 4,
-        help="Number of concurrent threads for copying.\n(Not used for unpacking).",
+        help="Number of concurrent threads for copying or .zip extraction.",
     )
     parser.add_argument(
         "-b",
         "--buffer",
         type=int,
-        default=1048576,  # 1MB
+        default=_DEFAULT_BUFFER_SIZE,
         help="Buffer size for reading/writing files in bytes.\n(Only for copy mode).",
     )
+    parser.add_argument(
+        "--direct-io",
+        action="store_true",
+        help="Bypass the OS file cache for files over 1GB.\n(Only for copy mode).",
+    )
+    parser.add_argument(
+        "--pin-threads",
+        action="store_true",
+        help="Pin each copy thread to its own CPU core.\n(Only for copy mode).",
+    )
     parser.add_argument(
         "--verify",
         action="store_true",
         help="Verify file integrity after copy using SHA-256 checksum.\n(Only for copy mode).",
     )
+    parser.add_argument(
+        "--hash",
+        choices=sorted(_HASH_FACTORIES),
+        default="sha256",
+        help="Checksum used by --verify; blake3 needs the blake3 package.\n(Only for copy mode).",
+    )
+    parser.add_argument(
+        "--verify-fast",
+        action="store_true",
+        help="Like --verify, but files over 64MB get a SHA-256 tree hash of 16MB\nblocks, checked on all cores. (Only for copy mode).",
+    )
 
     args = parser.parse_args()
 
@@ -804,26 +2370,68 @@ def main_cli():
     # because `-h` will trigger it. `argparse` handles the exit on `-h` itself.
 
     # --- Progress Bar Handling for CLI ---
+    # Worker threads only append (files, bytes) deltas to a deque (atomic
+    # under the GIL); a single refresher thread drains it into the bars a few
+    # times per second, so tqdm's lock never sits on the copy hot path.
     pbar_files = None
     pbar_bytes = None
+    completed = collections.deque()
+    stop_refresh = threading.Event()
+    refresher = None
+    scanning = False
+
+    def drain_completed():
+        files = 0
+        size = 0
+        while completed:
+            done, nbytes = completed.popleft()
+            files += done
+            size += nbytes
+        if files:
+            pbar_files.update(files)
+        if size:
+            pbar_bytes.update(size)
+
+    def refresh_bars():
+        while not stop_refresh.wait(_CLI_REFRESH_INTERVAL):
+            drain_completed()
 
     def cli_progress_callback(event_type, data):
-        nonlocal pbar_files, pbar_bytes
-        if event_type == "start":
-            pbar_files = tqdm(total=data["files"], unit="file", desc="Files")
+        nonlocal pbar_files, pbar_bytes, refresher, scanning
+        if event_type == "scan":
+            scanning = True
+            print(f"\rScanning... {data['files']} files", end="", file=sys.stderr)
+        elif event_type == "start":
+            if scanning:
+                print(file=sys.stderr)  # keep the scan line above the bars
+                scanning = False
+            pbar_files = tqdm(
+                total=data["files"],
+                unit="file",
+                desc="Files",
+                mininterval=_CLI_REFRESH_INTERVAL,
+            )
             pbar_bytes = tqdm(
                 total=data["bytes"],
                 unit="B",
                 desc="Size ",
                 unit_scale=True,
                 unit_divisor=1024,
+                mininterval=_CLI_REFRESH_INTERVAL,
             )
+            refresher = threading.Thread(target=refresh_bars, daemon=True)
+            refresher.start()
         elif event_type == "file":
-            if pbar_files:
-                pbar_files.update(1)
-            if pbar_bytes and data > 0:
-                pbar_bytes.update(data)
+            completed.append((1, data))
+        elif event_type == "bytes":
+            completed.append((0, data))
         elif event_type == "finish":
+            if scanning:
+                print(file=sys.stderr)  # nothing to copy after all
+            if refresher:
+                stop_refresh.set()
+                refresher.join()
+                drain_completed()
             if pbar_files:
                 pbar_files.close()
             if pbar_bytes:
@@ -833,17 +2441,24 @@ def main_cli():
         if args.unpack:
             print(f"Unpacking {args.source} to {args.destination}...")
             engine = UnpackEngine()
-            engine.run_unpack(args.source, args.destination, cli_progress_callback)
+            engine.run_unpack(
+                args.source, args.destination, cli_progress_callback, args.workers
+            )
             print("\n✅ Unpacking completed successfully!")
         else:
             print(f"Copying {args.source} to {args.destination}...")
-            engine = CopyEngine()
+            engine = CopyEngine(
+                direct_io=args.direct_io,
+                tree_hash=args.verify_fast,
+                pin_threads=args.pin_threads,
+                hash_name=args.hash,
+            )
             errors = engine.run_copy(
                 args.source,
                 args.destination,
                 args.workers,
                 args.buffer,
-                args.verify,
+                args.verify or args.verify_fast,
                 cli_progress_callback,
             )
 
@@ -862,16 +2477,14 @@ def main_cli():
 
 
 if __name__ == "__main__":
+    # Lets the frozen executable act as a copy worker process.
+    multiprocessing.freeze_support()
+
     is_cli_mode = len(sys.argv) > 1
 
     if is_cli_mode:
         main_cli()
     else:
         # We are in GUI mode. Hide the console window.
-        try:
-            console_window = ctypes.windll.kernel32.GetConsoleWindow()
-            if console_window != 0:
-                ctypes.windll.user32.ShowWindow(console_window, 0)  # 0 = SW_HIDE
-        except Exception:
-            pass
+        _hide_console_window()
         main_gui()
@@ -0,0 +1,93 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import supercopy  # noqa: E402
+
+_CHUNK = 64 * 1024
+_real_copy_file_range = getattr(os, "copy_file_range", None)
+
+
+def _early_zero(src, dst, count, offset_src, offset_dst):
+    """copy_file_range that copies a little of each range, then returns 0."""
+    if offset_src % _CHUNK:
+        return 0
+    return _real_copy_file_range(src, dst, min(count, 1000), offset_src, offset_dst)
+
+
+@unittest.skipUnless(hasattr(os, "copy_file_range"), "needs copy_file_range")
+class CopyRangesTest(unittest.TestCase):
+    """Range copies must stay complete when copy_file_range stops early."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.src = os.path.join(self.tmp.name, "src")
+        self.dst = os.path.join(self.tmp.name, "dst")
+        patcher = mock.patch.multiple(
+            supercopy, _RANGE_COPY_CHUNK=_CHUNK, _RANGE_COPY_MIN_SIZE=_CHUNK
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _copy(self, data, size, fake_copy_file_range):
+        with open(self.src, "wb") as f:
+            f.write(data)
+        events = []
+        src_fd = os.open(self.src, os.O_RDONLY)
+        dst_fd = os.open(self.dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            with mock.patch.object(os, "copy_file_range", fake_copy_file_range):
+                reported = supercopy._copy_ranges(
+                    src_fd, dst_fd, size, lambda kind, n: events.append(n)
+                )
+        finally:
+            os.close(dst_fd)
+            os.close(src_fd)
+        with open(self.dst, "rb") as f:
+            return f.read(), reported, sum(events)
+
+    def test_copy_file_range_returning_zero_early(self):
+        data = os.urandom(5 * _CHUNK + 123)
+        copied, reported, events = self._copy(data, len(data), _early_zero)
+        self.assertEqual(copied, data)
+        self.assertEqual(reported, len(data))
+        self.assertEqual(events, len(data))
+
+    def test_bytes_appended_after_stat_are_copied(self):
+        data = os.urandom(4 * _CHUNK + 7)
+        copied, reported, _ = self._copy(data, 3 * _CHUNK, os.copy_file_range)
+        self.assertEqual(copied, data)
+        self.assertEqual(reported, len(data))
+
+    def test_unsupported_pair_falls_back(self):
+        def unsupported(*args):
+            raise OSError(supercopy.errno.EXDEV, "cross-device")
+
+        copied, reported, _ = self._copy(
+            os.urandom(2 * _CHUNK), 2 * _CHUNK, unsupported
+        )
+        self.assertIsNone(reported)
+        self.assertEqual(copied, b"")
+
+    def test_copy_file_task_end_to_end(self):
+        data = os.urandom(3 * _CHUNK + 1)
+        with open(self.src, "wb") as f:
+            f.write(data)
+        engine = supercopy.CopyEngine()
+        engine.same_filesystem = False
+        with mock.patch.object(os, "copy_file_range", _early_zero):
+            _, error = engine._copy_file_task(
+                self.src, self.dst, len(data), 1 << 20, False, lambda *a: None
+            )
+        self.assertIsNone(error)
+        with open(self.dst, "rb") as f:
+            self.assertEqual(f.read(), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import supercopy  # noqa: E402
+
+
+@unittest.skipUnless(
+    hasattr(os, "sched_getaffinity") and hasattr(os, "copy_file_range"),
+    "needs Linux thread affinity and copy_file_range",
+)
+class PinThreadsTest(unittest.TestCase):
+    """--pin-threads must not confine the shared block pool to one CPU."""
+
+    def test_block_pool_keeps_all_cpus(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        src = os.path.join(tmp.name, "src")
+        os.mkdir(src)
+        size = supercopy._RANGE_COPY_MIN_SIZE + 12345
+        with open(os.path.join(src, "huge.bin"), "wb") as f:
+            f.truncate(size)  # sparse, so the test stays quick
+
+        seen = []
+        real_copy_range = supercopy._copy_range
+
+        def recording_copy_range(*args):
+            if threading.current_thread().name.startswith("supercopy-block"):
+                seen.append(os.sched_getaffinity(0))
+            return real_copy_range(*args)
+
+        # A fresh pool, so its threads are started by a pinned copy worker.
+        with mock.patch.object(supercopy, "_block_executor", None), mock.patch.object(
+            supercopy, "_copy_range", recording_copy_range
+        ):
+            engine = supercopy.CopyEngine(pin_threads=True)
+            errors = engine.run_copy(
+                src, os.path.join(tmp.name, "dst"), 2, None, False, lambda *a: None
+            )
+            pool = supercopy._block_executor
+        if pool is not None:
+            pool.shutdown()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            os.path.getsize(os.path.join(tmp.name, "dst", "huge.bin")), size
+        )
+        self.assertTrue(seen, "no range ran on the block pool")
+        for cpus in seen:
+            self.assertEqual(cpus, supercopy._PROCESS_CPUS)
+
+
+if __name__ == "__main__":
+    unittest.main()